@@ -12,6 +12,16 @@
 
 from __future__ import annotations
 
+from operator import index
+from typing import Any
+
+from numpy import dtype, empty_like, ndarray, right_shift, uint64
+
+_SWAR_PARITY_SHIFTS = tuple(uint64(shift) for shift in (32, 16, 8, 4, 2, 1))
+
+# Note: `int.bit_count` is only available from Python 3.10 onwards
+_bit_count = getattr(int, "bit_count", lambda integer: bin(integer).count("1"))
+
 
 ################################################################################
 ## UTILS
@@ -35,5 +45,25 @@ def binary_digit(value: int, place: int) -> bool:
 
 def parity_bit(integer: int, even: bool = True) -> bool:
     """Return the parity bit for a given integer."""
-    even_bit = bin(integer).count("1") % 2
+    even_bit = _bit_count(index(integer)) & 1  # Note: `int.bit_count` rejects NumPy integers
     return bool(even_bit) if even else (not even_bit)
+
+
+def parity_bits(
+    integers: ndarray[Any, dtype[uint64]], num_bits: int = 64
+) -> ndarray[Any, dtype[uint64]]:
+    """Return the (even) parity bits for an array of 64-bit unsigned integers.
+
+    Parity is computed for all entries at once by XOR-folding halves of each
+    integer onto themselves (i.e. SWAR), leaving the parity in the lowest bit.
+    Folds are performed in place, and only as many as needed to cover the
+    lowest ``num_bits`` binary digits (i.e. where all set bits are assumed to be).
+    """
+    folded = integers.copy()
+    shifted = empty_like(folded)
+    for shift in _SWAR_PARITY_SHIFTS:
+        if shift < num_bits:
+            right_shift(folded, shift, out=shifted)
+            folded ^= shifted
+    folded &= uint64(1)
+    return folded
@@ -25,9 +25,10 @@ def group_elements(elements: Iterable, group_size: int) -> Iterator[tuple]:
     Yields:
         The next grouped tuple
     """
-    if not isinstance(elements, Iterable):
-        raise TypeError("Elements argument must be iterable.")
+    try:
+        iterator = iter(elements)
+    except TypeError as error:
+        raise TypeError("Elements argument must be iterable.") from error
     if not isinstance(group_size, int) or group_size < 1:
         raise TypeError("Group size argument must be non-zero positive int.")
-    multi_iterable = [iter(elements)] * group_size
-    yield from zip(*multi_iterable)
+    yield from zip(*(iterator,) * group_size)
@@ -12,6 +12,8 @@
 
 from __future__ import annotations
 
+from itertools import islice
+
 from qiskit.circuit import QuantumCircuit
 
 
@@ -21,12 +23,14 @@ from qiskit.circuit import QuantumCircuit
 def compose_circuits_w_metadata(*circuits: QuantumCircuit, inplace: bool = False) -> QuantumCircuit:
     """Compose quantum circuits merging metadata."""
     # TODO: `circuit.compose(qc, inplace=True)` return `self` (i.e. Qiskit-Terra)
-    # Note: simplified implementation after above TODO using `functools.reduce`
-    # composition = reduce(lambda base, next: base.compose(next, inplace=True), circuits)
-    # composition.metadata = {k: v for c in circuits for k, v in c.metadata.items()}
+    if len(circuits) == 1:
+        return circuits[0] if inplace else circuits[0].copy()
+    metadata = {k: v for c in circuits for k, v in c.metadata.items()}
     composition = circuits[0] if inplace else circuits[0].copy()
-    appendages = (circuits[i] for i in range(1, len(circuits)))
+    appendages = islice(circuits, 1, None)
+    # Note: simplified loop after above TODO using `functools.reduce`
+    # composition = reduce(lambda qc, next: qc.compose(next, inplace=True), appendages, composition)
     for circuit in appendages:
         composition.compose(circuit, inplace=True)
-        composition.metadata.update(circuit.metadata)
+    composition.metadata = metadata
     return composition
@@ -12,7 +12,7 @@
 
 from __future__ import annotations
 
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import QuantumCircuit, Qubit
 from qiskit.transpiler.layout import Layout, TranspileLayout
 
 
@@ -24,9 +24,10 @@ def infer_initial_permutation(circuit: QuantumCircuit) -> tuple[int, ...]:
     transpile_layout: TranspileLayout = circuit.layout
     if transpile_layout is None:
         return tuple(range(circuit.num_qubits))
-    position_qubit_mapping = {p: q for q, p in transpile_layout.input_qubit_mapping.items()}
-    num_qubits = len(position_qubit_mapping)
-    virtual_qubits = (position_qubit_mapping[p] for p in range(num_qubits))
+    input_qubit_mapping = transpile_layout.input_qubit_mapping
+    virtual_qubits: list[Qubit | None] = [None] * len(input_qubit_mapping)
+    for qubit, position in input_qubit_mapping.items():
+        virtual_qubits[position] = qubit
     return tuple(transpile_layout.initial_layout[q] for q in virtual_qubits)
 
 
@@ -51,9 +52,13 @@ def infer_total_permutation(circuit: QuantumCircuit) -> tuple[int, ...]:
 def infer_total_layout(circuit: QuantumCircuit) -> Layout:
     """Infer total transpilation layout (i.e. from virtual circuit to physical end)."""
     transpile_layout: TranspileLayout = circuit.layout
+    qubits = circuit.qubits
     if transpile_layout is None:
-        return Layout(dict(enumerate(circuit.qubits)))
-    initial = transpile_layout.initial_layout
-    final = transpile_layout.final_layout or Layout(dict(enumerate(circuit.qubits)))
-    layout_dict = {q: final[circuit.qubits[i]] for q, i in initial.get_virtual_bits().items()}
+        return Layout(dict(enumerate(qubits)))
+    initial_bits = transpile_layout.initial_layout.get_virtual_bits()
+    final_layout = transpile_layout.final_layout
+    final_bits = (  # Note: skips `Layout.__getitem__` lookups in both directions
+        final_layout.get_virtual_bits() if final_layout else {q: i for i, q in enumerate(qubits)}
+    )
+    layout_dict = {q: final_bits[qubits[i]] for q, i in initial_bits.items()}
     return Layout(layout_dict)
@@ -12,8 +12,10 @@
 
 from __future__ import annotations
 
-from numpy import arange
-from qiskit.circuit import Measure, QuantumCircuit, Qubit
+from functools import lru_cache
+
+from numpy import bool_, flatnonzero, frombuffer
+from qiskit.circuit import QuantumCircuit, Qubit
 from qiskit.quantum_info.operators import Pauli
 
 
@@ -28,13 +30,24 @@ def build_pauli_measurement(pauli: Pauli | str) -> QuantumCircuit:
     constant (1) and does not need to be performed. We leave this behavior as
     default nonetheless.
     """
-    pauli = Pauli(pauli)
-    measured_qubit_indices = arange(pauli.num_qubits)[pauli.z | pauli.x]
-    measured_qubit_indices = set(measured_qubit_indices.tolist()) or {0}
-    circuit = QuantumCircuit(pauli.num_qubits, len(measured_qubit_indices))
+    if not isinstance(pauli, Pauli):
+        pauli = Pauli(pauli)
+    return _symplectic_pauli_measurement(pauli.z.tobytes(), pauli.x.tobytes()).copy()
+
+
+@lru_cache(maxsize=1024)
+def _symplectic_pauli_measurement(z_data: bytes, x_data: bytes) -> QuantumCircuit:
+    """Cached version of `build_pauli_measurement` keyed on raw symplectic (boolean) data.
+
+    Note: returned circuits are shared across calls, and must not be mutated.
+    """
+    z_array, x_array = frombuffer(z_data, dtype=bool_), frombuffer(x_data, dtype=bool_)
+    measured_qubit_indices = flatnonzero(z_array | x_array).tolist() or [0]
+    z_list, x_list = z_array.tolist(), x_array.tolist()  # Note: avoids NumPy scalar indexing
+    circuit = QuantumCircuit(len(z_list), len(measured_qubit_indices))
     for cbit, qubit in enumerate(measured_qubit_indices):
-        if pauli.x[qubit]:
-            if pauli.z[qubit]:
+        if x_list[qubit]:
+            if z_list[qubit]:
                 circuit.sdg(qubit)
             circuit.h(qubit)
         circuit.measure(qubit, cbit)
@@ -43,4 +56,4 @@ def build_pauli_measurement(pauli: Pauli | str) -> QuantumCircuit:
 
 def get_measured_qubits(circuit: QuantumCircuit) -> set[Qubit]:
     """Get qubits with at least one measurement gate in them."""
-    return {qargs[0] for gate, qargs, _ in circuit if isinstance(gate, Measure)}
+    return {instruction.qubits[0] for instruction in circuit.get_instructions("measure")}
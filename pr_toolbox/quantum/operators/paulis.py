@@ -12,10 +12,10 @@
 
 from __future__ import annotations
 
-from functools import reduce
+from functools import lru_cache
 from typing import Any
 
-from numpy import bool_, dtype, ndarray, packbits
+from numpy import bool_, dtype, frombuffer, ndarray, packbits, uint8
 from qiskit.quantum_info.operators import Pauli
 
 
@@ -26,9 +26,30 @@ def pauli_integer_mask(pauli: Pauli | str) -> int:
     This is an integer representation of the binary string with a one where
     there are Paulis, and zero where there are identities.
     """
-    pauli = Pauli(pauli)
-    pauli_mask: ndarray[Any, dtype[bool_]] = pauli.z | pauli.x
-    packed_mask: list[int] = packbits(  # pylint: disable=no-member
+    if isinstance(pauli, str):
+        return _label_integer_mask(pauli)
+    if not isinstance(pauli, Pauli):
+        pauli = Pauli(pauli)
+    return _symplectic_integer_mask(pauli.z.tobytes(), pauli.x.tobytes())
+
+
+@lru_cache(maxsize=4096)
+def _label_integer_mask(label: str) -> int:
+    """Cached version of `pauli_integer_mask` keyed on Pauli labels."""
+    pauli = Pauli(label)
+    return _pack_integer_mask(pauli.z | pauli.x)
+
+
+@lru_cache(maxsize=4096)
+def _symplectic_integer_mask(z_data: bytes, x_data: bytes) -> int:
+    """Cached version of `pauli_integer_mask` keyed on raw symplectic (boolean) data."""
+    pauli_mask = frombuffer(z_data, dtype=bool_) | frombuffer(x_data, dtype=bool_)
+    return _pack_integer_mask(pauli_mask)
+
+
+def _pack_integer_mask(pauli_mask: ndarray[Any, dtype[bool_]]) -> int:
+    """Pack boolean mask into an integer (little endian)."""
+    packed_mask: ndarray[Any, dtype[uint8]] = packbits(  # pylint: disable=no-member
         pauli_mask, bitorder="little"
-    ).tolist()
-    return reduce(lambda value, element: (value << 8) | element, reversed(packed_mask))
+    )
+    return int.from_bytes(bytes(packed_mask), byteorder="little")
@@ -12,12 +12,10 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable
-from functools import singledispatch
 from typing import Union
 
-from numpy import sqrt
+from numpy import float64, fromiter, sqrt
 from qiskit.result import Counts, QuasiDistribution
 
 FrequenciesLike = Union[Counts, QuasiDistribution]
@@ -26,7 +24,6 @@ FrequenciesLike = Union[Counts, QuasiDistribution]
 ################################################################################
 ## FREQUENCIES
 ################################################################################
-@singledispatch
 def map_frequencies(
     frequencies: FrequenciesLike | dict, mapper: Callable
 ) -> FrequenciesLike | dict:
@@ -39,108 +36,151 @@ def map_frequencies(
     Returns:
         New frequencies with readout bits mapped according to input callable.
     """
-    raise TypeError(
-        f"Invalid frequencies type. Expected `Counts` or `QuasiDistribution` or `dict'"
-        f" but got {type(frequencies)} instead."
-    )
+    return _transform_frequencies(frequencies, _map_dict, mapper)
 
 
-@map_frequencies.register
-def map_dict(frequencies: dict, mapper) -> dict:
-    """Map frequency dictionary by reassigning keys according to input callable.
+def bitflip_frequencies(frequencies: FrequenciesLike, bitflips: int) -> FrequenciesLike:
+    """Flip readout bits in frequencies according to the input bitflips (int encoded).
 
     Args:
-        frequencies: the frequency dictionary to process.
-        mapper: the callable to map readout bits (i.e. frequencies keys).
+        frequencies: the frequencies to process.
+        bitflips: the bitflips to be applied.
 
     Returns:
-        New frequency dictionary with readout bits mapped according to input callable.
+        New frequencies with readout bits flipped according to input.
     """
-    if not all(isinstance(k, int) for k in frequencies.keys()):
-        raise TypeError("Invalid key types for frequencies. Keys must be of type `int'.")
-    if not all(isinstance(v, (int, float)) for v in frequencies.values()):
-        raise TypeError(
-            "Invalid value types for frequencies. Values must be of type `int' or `float'."
-        )
-    frequencies_dict: dict[int, int | float] = defaultdict(lambda: 0)
-    for readout, freq in frequencies.items():
-        readout = mapper(readout)
-        frequencies_dict[readout] += freq
-    return frequencies_dict
+    return _transform_frequencies(frequencies, _bitflip_dict, bitflips)
 
 
-@map_frequencies.register
-def map_counts(counts: Counts, mapper: Callable) -> Counts:
-    """Map counts by reassigning keys according to input callable.
+def bitmask_frequencies(frequencies: FrequenciesLike, bitmask: int) -> FrequenciesLike:
+    """Apply mask to readout bits in frequencies.
 
     Args:
-        counts: the counts to process.
-        mapper: the callable to map readout bits (i.e. counts keys).
+        frequencies: the frequencies to process.
+        bitmask: the bit mask to be applied.
 
     Returns:
-        New counts with readout bits mapped according to input callable.
+        New frequencies with readout bits masked according to input.
     """
-    frequencies: dict = counts.int_outcomes()
-    frequencies = map_frequencies(frequencies, mapper)
-    return Counts(frequencies)
+    return _transform_frequencies(frequencies, _bitmask_dict, bitmask)
 
 
-@map_frequencies.register
-def map_quasi_dist(quasi_dist: QuasiDistribution, mapper: Callable) -> QuasiDistribution:
-    """Map quasi-distributions by reassigning keys according to input callable.
+def counts_to_quasi_dist(counts: Counts) -> QuasiDistribution:
+    """Infers a :class:`~qiskit.result.QuasiDistribution` from :class:`~qiskit.result.Counts`.
 
     Args:
-        quasi_dist: the quasi-distributions to process.
-        mapper: the callable to map readout bits (i.e. quasi_dist keys).
+        counts: the counts to convert.
 
     Returns:
-        New QuasiDistribution with readout bits mapped according to input callable.
+        New QuasiDistribution inferred from counts.
     """
-    frequencies: dict = dict(quasi_dist)
-    frequencies = map_frequencies(frequencies, mapper)
-    return QuasiDistribution(
-        frequencies, shots=quasi_dist.shots, stddev_upper_bound=quasi_dist.stddev_upper_bound
-    )
+    if not isinstance(counts, Counts):
+        raise TypeError(f"Invalid counts type. Expected `Counts` but got {type(counts)} instead.")
+    return outcomes_to_quasi_dist(_int_outcomes(counts))
 
 
-def bitflip_frequencies(frequencies: FrequenciesLike, bitflips: int) -> FrequenciesLike:
-    """Flip readout bits in frequencies according to the input bitflips (int encoded).
+def outcomes_to_quasi_dist(outcomes: dict[int, int]) -> QuasiDistribution:
+    """Infers a :class:`~qiskit.result.QuasiDistribution` from integer-keyed counts.
+
+    Note: skips building intermediate :class:`~qiskit.result.Counts` objects.
 
     Args:
-        frequencies: the frequencies to process.
-        bitflips: the bitflips to be applied.
+        outcomes: the counts dictionary (i.e. integer readouts to shots) to convert.
 
     Returns:
-        New frequencies with readout bits flipped according to input.
+        New QuasiDistribution inferred from outcomes.
     """
-    return map_frequencies(frequencies, lambda readout: readout ^ bitflips)
+    if not isinstance(outcomes, dict):
+        raise TypeError(f"Invalid outcomes type. Expected `dict` but got {type(outcomes)} instead.")
+    shots = sum(outcomes.values())
+    std_dev = sqrt(1 / shots) if shots else None
+    values = fromiter(outcomes.values(), dtype=float64, count=len(outcomes))
+    values /= shots or 1
+    probabilities = dict(zip(outcomes.keys(), values.tolist()))
+    return QuasiDistribution(probabilities, shots=shots, stddev_upper_bound=std_dev)
 
 
-def bitmask_frequencies(frequencies: FrequenciesLike, bitmask: int) -> FrequenciesLike:
-    """Apply mask to readout bits in frequencies.
+################################################################################
+## AUXILIARY
+################################################################################
+def _validate_frequencies_dict(frequencies: dict) -> None:
+    """Validate key and value types in frequency dictionary."""
+    if not all(isinstance(k, int) for k in frequencies.keys()):
+        raise TypeError("Invalid key types for frequencies. Keys must be of type `int'.")
+    if not all(isinstance(v, (int, float)) for v in frequencies.values()):
+        raise TypeError(
+            "Invalid value types for frequencies. Values must be of type `int' or `float'."
+        )
+
+
+def _int_outcomes(counts: Counts) -> dict[int, int]:
+    """Build counts dictionary with integer keys, decoding bitstrings in a single pass.
+
+    Note: falls back to :meth:`~qiskit.result.Counts.int_outcomes` on invalid keys
+    (e.g. to raise on dit strings).
+    """
+    if counts.int_raw is not None:
+        return counts.int_raw
+    if counts.bitstring_regex.search("".join(counts)):  # Note: validates all keys at once
+        try:
+            return {int(key.replace(" ", ""), 2): value for key, value in counts.items()}
+        except ValueError:
+            pass
+    return counts.int_outcomes()
+
+
+def _transform_frequencies(
+    frequencies: FrequenciesLike | dict, transform: Callable[..., dict], *args
+) -> FrequenciesLike | dict:
+    """Apply transform to frequencies as a dictionary, rebuilding the original type.
 
     Args:
         frequencies: the frequencies to process.
-        bitmask: the bit mask to be applied.
+        transform: callable taking a frequency dictionary (and extra args) into a new one.
+        args: extra arguments to pass on to the transform.
 
     Returns:
-        New frequencies with readout bits masked according to input.
+        New frequencies of the same type as the input.
     """
-    return map_frequencies(frequencies, lambda readout: readout & bitmask)
+    if isinstance(frequencies, Counts):
+        return Counts(transform(_int_outcomes(frequencies), *args))
+    if isinstance(frequencies, QuasiDistribution):
+        return QuasiDistribution(
+            transform(frequencies, *args),
+            shots=frequencies.shots,
+            stddev_upper_bound=frequencies.stddev_upper_bound,
+        )
+    if isinstance(frequencies, dict):
+        _validate_frequencies_dict(frequencies)
+        return transform(frequencies, *args)
+    raise TypeError(
+        f"Invalid frequencies type. Expected `Counts` or `QuasiDistribution` or `dict'"
+        f" but got {type(frequencies)} instead."
+    )
 
 
-def counts_to_quasi_dist(counts: Counts) -> QuasiDistribution:
-    """Infers a :class:`~qiskit.result.QuasiDistribution` from :class:`~qiskit.result.Counts`.
+def _map_dict(frequencies: dict, mapper: Callable) -> dict:
+    """Map frequency dictionary by reassigning keys according to input callable."""
+    frequencies_dict: dict[int, int | float] = {}
+    for readout, freq in frequencies.items():
+        readout = mapper(readout)
+        frequencies_dict[readout] = frequencies_dict.get(readout, 0) + freq
+    return frequencies_dict
 
-    Args:
-        counts: the counts to convert.
 
-    Returns:
-        New QuasiDistribution inferred from counts.
-    """
-    if not isinstance(counts, Counts):
-        raise TypeError(f"Invalid counts type. Expected `Counts` but got {type(counts)} instead.")
-    shots = counts.shots()
-    std_dev = sqrt(1 / shots) if shots else None
-    probabilities = {k: v / (shots or 1) for k, v in counts.int_outcomes().items()}
-    return QuasiDistribution(probabilities, shots=shots, stddev_upper_bound=std_dev)
+def _bitflip_dict(frequencies: dict, bitflips: int) -> dict:
+    """Flip readout bits in frequency dictionary (bijective, no aggregation needed)."""
+    if not bitflips:
+        return dict(frequencies)
+    return {readout ^ bitflips: freq for readout, freq in frequencies.items()}
+
+
+def _bitmask_dict(frequencies: dict, bitmask: int) -> dict:
+    """Apply mask to readout bits in frequency dictionary aggregating collisions."""
+    if not bitmask & (bitmask + 1) and max(frequencies, default=0) <= bitmask:
+        return dict(frequencies)  # Note: low-ones mask covering all readouts
+    frequencies_dict: dict[int, int | float] = {}
+    for readout, freq in frequencies.items():
+        readout &= bitmask
+        frequencies_dict[readout] = frequencies_dict.get(readout, 0) + freq
+    return frequencies_dict
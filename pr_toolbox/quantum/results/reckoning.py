@@ -14,24 +14,51 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from collections.abc import Sequence
-from typing import Union
-
-from numpy import array, dot, real_if_close, sqrt, vstack
+from collections.abc import Collection, Iterable, Sequence
+from functools import lru_cache
+from math import sqrt as math_sqrt
+from typing import Any, Union
+
+from numpy import (
+    array,
+    bitwise_xor,
+    bool_,
+    complex128,
+    concatenate,
+    dot,
+    dtype,
+    finfo,
+    float64,
+    frombuffer,
+    fromiter,
+    ndarray,
+    packbits,
+    sqrt,
+    uint64,
+)
 from qiskit.opflow import PauliSumOp
 from qiskit.primitives.utils import init_observable as normalize_operator
-from qiskit.quantum_info.operators import Pauli, SparsePauliOp
+from qiskit.quantum_info.operators import Pauli, PauliList, SparsePauliOp
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.result import Counts, QuasiDistribution
 
-from pr_toolbox.binary import parity_bit
+from pr_toolbox.binary import parity_bit, parity_bits
 from pr_toolbox.quantum.operators import pauli_integer_mask
 
-from .frequencies import FrequenciesLike, bitmask_frequencies, counts_to_quasi_dist
+from .frequencies import (
+    FrequenciesLike,
+    bitmask_frequencies,
+    counts_to_quasi_dist,
+    outcomes_to_quasi_dist,
+)
 
 ReckoningResult = namedtuple("ReckoningResult", ("expval", "std_error"))
 OperatorType = Union[BaseOperator, PauliSumOp, str]  # TODO: to types
 
+PHASE_COEFFS = array([1, -1j, -1, 1j])  # Note: `(-1j) ** phase` for group phase in `range(4)`
+MAX_BROADCAST_SIZE = 2**16
+IMAG_TOLERANCE = 100 * finfo(float64).eps  # Note: same as `numpy.real_if_close` default
+
 
 ################################################################################
 ## EXPECTATION VALUE RECKONER INTERFACE
@@ -70,9 +97,7 @@ class ExpvalReckoner(ABC):
         operator_list = self._validate_operator_list(operator_list)
         self._cross_validate_lists(frequencies_list, operator_list)
         expval, std_error = self._reckon(frequencies_list, operator_list)
-        expval = real_if_close(expval).tolist()  # Note: `tolist` casts to python core numeric type
-        std_error = array(std_error).tolist()
-        return ReckoningResult(expval, std_error)
+        return ReckoningResult(_to_python_scalar(expval), float(std_error))
 
     def reckon_operator(
         self, frequencies: FrequenciesLike, operator: OperatorType
@@ -99,9 +124,7 @@ class ExpvalReckoner(ABC):
         operator = self._validate_operator(operator)
         # TODO: cross-validation
         expval, std_error = self._reckon_operator(frequencies, operator)
-        expval = real_if_close(expval).tolist()  # Note: `tolist` casts to python core numeric type
-        std_error = array(std_error).tolist()
-        return ReckoningResult(expval, std_error)
+        return ReckoningResult(_to_python_scalar(expval), float(std_error))
 
     def reckon_pauli(self, frequencies: FrequenciesLike, pauli: Pauli) -> ReckoningResult:
         """Reckon expectation value from frequencies and pauli.
@@ -124,9 +147,7 @@ class ExpvalReckoner(ABC):
         pauli = self._validate_pauli(pauli)
         # TODO: cross-validation
         expval, std_error = self._reckon_pauli(frequencies, pauli)
-        expval = real_if_close(expval).tolist()  # Note: `tolist` casts to python core numeric type
-        std_error = array(std_error).tolist()
-        return ReckoningResult(expval, std_error)
+        return ReckoningResult(_to_python_scalar(expval), float(std_error))
 
     def reckon_frequencies(self, frequencies: FrequenciesLike) -> ReckoningResult:
         """Reckon expectation value and associated std error from frequencies.
@@ -143,9 +164,7 @@ class ExpvalReckoner(ABC):
         """
         frequencies = self._validate_frequencies(frequencies)
         expval, std_error = self._reckon_frequencies(frequencies)
-        expval = real_if_close(expval).tolist()  # Note: `tolist` casts to python core numeric type
-        std_error = array(std_error).tolist()
-        return ReckoningResult(expval, std_error)
+        return ReckoningResult(_to_python_scalar(expval), float(std_error))
 
     ################################################################################
     ## ABSTRACT METHODS
@@ -156,47 +175,46 @@ class ExpvalReckoner(ABC):
         frequencies_list: Sequence[QuasiDistribution],
         operator_list: Sequence[SparsePauliOp],
     ) -> ReckoningResult:
-        expval = 0.0
-        variance = 0.0
-        for value, error in (
+        results = [
             self._reckon_operator(frequencies, operator)
             for frequencies, operator in zip(frequencies_list, operator_list)
-        ):
-            expval += value
-            variance += error**2
-        return ReckoningResult(expval, sqrt(variance))
+        ]
+        expvals = array([expval for expval, _ in results])
+        std_errors = array([std_error for _, std_error in results], dtype=float64)
+        return ReckoningResult(expvals.sum(), math_sqrt(dot(std_errors, std_errors)))
 
     @abstractmethod
     def _reckon_operator(
         self, frequencies: QuasiDistribution, operator: SparsePauliOp
     ) -> ReckoningResult:
-        value_std_error_pairs = [
-            self._reckon_pauli(frequencies, pauli) for pauli in operator.paulis
-        ]
-        values, std_errors = vstack(value_std_error_pairs).T  # Note: like zip but array output
-        coeffs = array(operator.coeffs)
+        results = [self._reckon_pauli(frequencies, pauli) for pauli in operator.paulis]
+        values, std_errors = array(results).T  # Note: like zip but array output
+        coeffs = operator.coeffs
         expval = dot(values, coeffs)
         variance = dot(std_errors.real**2, (coeffs.real**2 + coeffs.imag**2))
-        return ReckoningResult(expval, sqrt(variance))
+        return ReckoningResult(expval, math_sqrt(variance))
 
     @abstractmethod
     def _reckon_pauli(self, frequencies: QuasiDistribution, pauli: Pauli) -> ReckoningResult:
         mask = pauli_integer_mask(pauli)
-        frequencies = bitmask_frequencies(frequencies, mask)
+        if mask:
+            frequencies = bitmask_frequencies(frequencies, mask)
+        else:  # Note: identity Pauli, all readouts collapse onto zero
+            frequencies = QuasiDistribution(
+                {0: sum(frequencies.values())},
+                shots=frequencies.shots,
+                stddev_upper_bound=frequencies.stddev_upper_bound,
+            )
         coeff = (-1j) ** pauli.phase
         expval, std_error = self._reckon_frequencies(frequencies)
         return ReckoningResult(coeff * expval, std_error)
 
     @abstractmethod
     def _reckon_frequencies(self, frequencies: QuasiDistribution) -> ReckoningResult:
-        shots = frequencies.shots or 1
-        expval: float = 0.0
-        for readout, freq in frequencies.items():
-            observation = (-1) ** parity_bit(readout, even=True)
-            expval += observation * freq
-        variance = 1 - expval**2
-        std_error = sqrt(variance / shots)
-        return ReckoningResult(expval, std_error)
+        observations = _readout_observations(frequencies.keys())
+        freqs = fromiter(frequencies.values(), dtype=float64, count=len(frequencies))
+        expval: float = dot(observations, freqs)
+        return ReckoningResult(expval, _std_error(expval, frequencies.shots))
 
     ################################################################################
     ## AUXILIARY
@@ -217,14 +235,19 @@ class ExpvalReckoner(ABC):
     def _validate_frequencies(frequencies: FrequenciesLike) -> QuasiDistribution:
         """Validate frequencies."""
         if isinstance(frequencies, QuasiDistribution):
-            return frequencies  # Note: issubclass(QuasiDistribution, dict) is True
-        if isinstance(frequencies, dict):
-            frequencies = Counts(frequencies)
-        if isinstance(frequencies, Counts):
-            frequencies = counts_to_quasi_dist(frequencies)
-        if not isinstance(frequencies, QuasiDistribution):
+            quasi_dist = frequencies  # Note: issubclass(QuasiDistribution, dict) is True
+        elif isinstance(frequencies, Counts):
+            quasi_dist = counts_to_quasi_dist(frequencies)  # Note: issubclass(Counts, dict)
+        elif isinstance(frequencies, dict):
+            if isinstance(next(iter(frequencies), 0), int):  # Note: no need to parse keys
+                quasi_dist = outcomes_to_quasi_dist(frequencies)
+            else:
+                quasi_dist = counts_to_quasi_dist(Counts(frequencies))
+        else:
             raise TypeError("Expected QuasiDistribution object.")
-        return frequencies
+        if min(quasi_dist, default=0) < 0:  # Note: would wrap around in `uint64` arrays
+            raise ValueError("Invalid frequencies readouts. Expected non-negative integers.")
+        return quasi_dist
 
     @classmethod
     def _validate_operator_list(
@@ -241,18 +264,22 @@ class ExpvalReckoner(ABC):
     @staticmethod
     def _validate_operator(operator: OperatorType) -> SparsePauliOp:
         """Validate operator."""
-        if isinstance(operator, (BaseOperator, PauliSumOp, str)):
+        if isinstance(operator, SparsePauliOp):
+            return operator  # Note: already normalized
+        if isinstance(operator, str):
+            return _normalize_label(operator)
+        if isinstance(operator, (BaseOperator, PauliSumOp)):
             return normalize_operator(operator)
         raise TypeError("Expected OperatorType object.")
 
     @staticmethod
     def _validate_pauli(pauli: Pauli) -> Pauli:
         """Validate Pauli."""
+        if isinstance(pauli, Pauli):
+            return pauli
         if isinstance(pauli, str):
-            pauli = Pauli(pauli)
-        elif not isinstance(pauli, Pauli):
-            raise TypeError(f"Expected Pauli, got {pauli!r} instead.")
-        return pauli
+            return Pauli(pauli)
+        raise TypeError(f"Expected Pauli, got {pauli!r} instead.")
 
     @staticmethod
     def _cross_validate_lists(
@@ -282,10 +309,130 @@ class CanonicalReckoner(ExpvalReckoner):
     def _reckon_operator(
         self, frequencies: QuasiDistribution, operator: SparsePauliOp
     ) -> ReckoningResult:
-        return super()._reckon_operator(frequencies, operator)
+        """Reckon all Paulis in the operator at once through masked readout parities.
+
+        Note: equivalent to the interface default, but bypassing `_reckon_pauli` and
+        `_reckon_frequencies`; subclasses overriding either must also override this method.
+        """
+        try:
+            readouts = fromiter(frequencies.keys(), dtype=uint64, count=len(frequencies))
+            masks, phase_coeffs = _pauli_list_arrays(operator.paulis)
+        except OverflowError:  # Note: readouts or masks wider than 64 bits
+            num_bits = max(max(frequencies, default=0).bit_length(), operator.num_qubits)
+            num_words = -(-num_bits // 64)  # Note: ceil division
+            readouts = _pack_words(frequencies.keys(), num_words)
+            masks = _pack_words(map(pauli_integer_mask, operator.paulis), num_words)
+            phase_coeffs = PHASE_COEFFS[operator.paulis.phase]
+        freqs = fromiter(frequencies.values(), dtype=float64, count=len(frequencies))
+        expvals = _masked_expvals(readouts, freqs, masks)
+        std_errors = _std_error(expvals, frequencies.shots)
+        values = phase_coeffs * expvals
+        coeffs = operator.coeffs
+        expval = dot(values, coeffs)
+        variance = dot(std_errors**2, (coeffs.real**2 + coeffs.imag**2))
+        return ReckoningResult(expval, math_sqrt(variance))  # Note: non-negative scalar
 
     def _reckon_pauli(self, frequencies: QuasiDistribution, pauli: Pauli) -> ReckoningResult:
         return super()._reckon_pauli(frequencies, pauli)
 
     def _reckon_frequencies(self, frequencies: QuasiDistribution) -> ReckoningResult:
         return super()._reckon_frequencies(frequencies)
+
+
+################################################################################
+## AUXILIARY
+################################################################################
+@lru_cache(maxsize=1024)
+def _normalize_label(label: str) -> SparsePauliOp:
+    """Cached operator normalization for Pauli labels.
+
+    Note: returned operators are shared across calls, and must not be mutated.
+    """
+    return normalize_operator(label)
+
+
+def _pauli_list_arrays(
+    paulis: PauliList,
+) -> tuple[ndarray[Any, dtype[uint64]], ndarray[Any, dtype[complex128]]]:
+    """Compute integer masks and phase coefficients for all Paulis in the input list.
+
+    Masks are cached by symplectic data (see `_symplectic_list_masks`).
+
+    Raises:
+        OverflowError: if any Pauli mask is wider than 64 bits.
+    """
+    z, x = paulis.z, paulis.x
+    masks = _symplectic_list_masks(z.tobytes(), x.tobytes(), z.shape)
+    return masks, PHASE_COEFFS[paulis.phase]
+
+
+@lru_cache(maxsize=1024)
+def _symplectic_list_masks(
+    z_data: bytes, x_data: bytes, shape: tuple[int, int]
+) -> ndarray[Any, dtype[uint64]]:
+    """Cached integer masks for Pauli lists keyed on raw symplectic (boolean) data.
+
+    Note: returned arrays are shared across calls, and therefore read-only.
+    """
+    pauli_masks = frombuffer(z_data, dtype=bool_) | frombuffer(x_data, dtype=bool_)
+    packed_masks = packbits(  # pylint: disable=no-member
+        pauli_masks.reshape(shape), axis=1, bitorder="little"
+    )
+    integer_masks = (int.from_bytes(row.tobytes(), byteorder="little") for row in packed_masks)
+    masks = fromiter(integer_masks, dtype=uint64, count=shape[0])
+    masks.flags.writeable = False
+    return masks
+
+
+def _to_python_scalar(value: complex) -> complex | float:
+    """Cast to python core numeric type, dropping negligible imaginary parts."""
+    if abs(value.imag) >= IMAG_TOLERANCE:
+        return complex(value)
+    return float(value.real)
+
+
+def _std_error(
+    expval: float | ndarray[Any, dtype[float64]], shots: int | None
+) -> float | ndarray[Any, dtype[float64]]:
+    """Compute std error for Pauli-Z expectation values (scalar or array) from shots."""
+    return sqrt((1 - expval**2) / (shots or 1))
+
+
+def _masked_expvals(
+    readouts: ndarray[Any, dtype[uint64]],
+    freqs: ndarray[Any, dtype[float64]],
+    masks: ndarray[Any, dtype[uint64]],
+) -> ndarray[Any, dtype[float64]]:
+    """Compute Pauli-Z expectation values of the masked readouts for each input mask.
+
+    Masks are broadcast against all readouts at once, in chunks bounded by
+    `MAX_BROADCAST_SIZE` elements to keep intermediate arrays cache-resident.
+    Readouts and masks wider than 64 bits can be passed as rows of 64-bit words
+    (see `_pack_words`), which get folded by XOR before computing parities.
+    """
+    num_bits = int(masks.max()).bit_length()
+    chunk_size = max(MAX_BROADCAST_SIZE // max(readouts.size, 1), 1)
+    odd_freqs = []  # Note: total frequency for readouts with odd parity
+    for i in range(0, len(masks), chunk_size):
+        masked = readouts & masks[i : i + chunk_size, None]
+        if masked.ndim > 2:
+            masked = bitwise_xor.reduce(masked, axis=-1)  # Note: parity preserving
+        odd_freqs.append(parity_bits(masked, num_bits) @ freqs)
+    return freqs.sum() - 2.0 * concatenate(odd_freqs)
+
+
+def _pack_words(integers: Iterable[int], num_words: int) -> ndarray[Any, dtype[uint64]]:
+    """Pack non-negative integers into rows of 64-bit words (little endian)."""
+    num_bytes = num_words * 8
+    data = b"".join(integer.to_bytes(num_bytes, "little") for integer in integers)
+    return frombuffer(data, dtype="<u8").astype(uint64, copy=False).reshape(-1, num_words)
+
+
+def _readout_observations(readouts: Collection[int]) -> ndarray[Any, dtype[float64]]:
+    """Compute Pauli-Z observations (i.e. plus or minus one) for all input readouts."""
+    try:
+        readouts_array = fromiter(readouts, dtype=uint64, count=len(readouts))
+    except OverflowError:  # Note: readouts wider than 64 bits
+        return array([1 - (parity_bit(readout) << 1) for readout in readouts], dtype=float64)
+    num_bits = int(readouts_array.max(initial=0)).bit_length()
+    return 1.0 - 2.0 * parity_bits(readouts_array, num_bits)
@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+from numpy import asarray
 from qiskit.primitives import EstimatorResult
 
 from pr_toolbox.serialization import NumPyEncoder, ReprEncoder
@@ -22,5 +23,6 @@ class EstimatorResultEncoder(NumPyEncoder, ReprEncoder):
 
     def default(self, o):
         if isinstance(o, EstimatorResult):
-            return {"values": o.values, "metadata": o.metadata}
+            # Note: `tolist` upfront spares the encoder a further `default` call for the array
+            return {"values": asarray(o.values).tolist(), "metadata": o.metadata}
         return super().default(o)
@@ -10,6 +10,7 @@
 
 """Type checking tools."""
 
+from math import isfinite
 from typing import Any
 
 
@@ -20,4 +21,4 @@ def isinteger(obj: Any) -> bool:
 
 def isreal(obj: Any) -> bool:
     """Check if object is a real number: int or float minus ``±Inf`` and ``NaN``."""
-    return isinstance(obj, int) or isinstance(obj, float) and float("-Inf") < obj < float("Inf")
+    return isinstance(obj, int) or isinstance(obj, float) and isfinite(obj)
@@ -10,6 +10,8 @@
 
 """Tests for quality descriptor."""
 
+from __future__ import annotations
+
 from copy import copy, deepcopy
 from typing import Any
 from unittest.mock import Mock
@@ -34,6 +36,15 @@ class EqualCopies:
             return False
         return self.value == __o.value
 
+    def __deepcopy__(self, memo: dict) -> EqualCopies:
+        memo[id(self)] = duplicate = self.__class__(deepcopy(self.value, memo))
+        return duplicate
+
+
+def build_dummy(descriptor: quality) -> Any:
+    """Build instance of a dummy class holding the input descriptor as attribute `q`."""
+    return type("Dummy", (), {"q": descriptor})()
+
 
 ################################################################################
 ## TESTS
@@ -51,8 +62,8 @@ class TestQualityInit:
 
     def test_custom(self):
         """Test custom quality values."""
-        fval = Mock()
-        feff = Mock()
+        fval = object()
+        feff = object()
         default = EqualCopies("default")
         null = EqualCopies("null")
         q = quality(fval, feff, default=default, null=null)
@@ -87,7 +98,7 @@ class TestQualityCall:
     def test_mutable_attrs(self, keys):
         """Test mutable attrs (i.e. reference can be accessed)."""
         q = quality()
-        kwargs = {k: Mock() for k in keys}
+        kwargs = {k: object() for k in keys}
         qq = q(**kwargs)
         assert q is not qq
         for key, value in kwargs.items():
@@ -129,8 +140,8 @@ class TestQualityCopy:
 
     def test_copy(self, name):
         """Test shallow copy."""
-        fval = Mock()
-        feff = Mock()
+        fval = object()
+        feff = object()
         default = EqualCopies("default")
         null = EqualCopies("null")
         descriptor = quality(fval, feff, default=default, null=null)
@@ -166,17 +177,15 @@ class TestQualityCopy:
         assert duplicate.name == descriptor.name
         assert duplicate.private_name == descriptor.private_name
 
-        memo_values = [fval, feff, default, null]
-        memo_values += [v.__dict__ for v in memo_values]
-        for value in memo.values():
-            if isinstance(value, quality):
-                assert value is duplicate
-            elif isinstance(value, list):
-                assert descriptor in value
-                for v in memo_values:
-                    assert v in value
-            else:
-                assert value in memo_values
+        originals = [fval, feff, default, null]
+        original_ids = {id(descriptor), *map(id, originals)}
+        assert {id(v) for v in memo.pop(id(memo))} == original_ids  # Note: keep alive list
+        assert memo.keys() == original_ids
+        assert memo[id(descriptor)] is duplicate
+        assert memo[id(fval)] is duplicate.fval
+        assert memo[id(feff)] is duplicate.feff
+        assert memo[id(default)] is duplicate._default
+        assert memo[id(null)] is duplicate._null
 
 
 class TestQualityProperties:
@@ -232,8 +241,7 @@ class TestQualityDescriptor:
             default = kwargs.get("default")
             null = kwargs.get("null")
             descriptor = quality(**kwargs)
-            Dummy = type("Dummy", (), {"q": descriptor})
-            d = Dummy()
+            d = build_dummy(descriptor)
             expected = None if default is UNSET and null is UNSET else default or null
             assert d.q is not UNSET
             assert d.q == expected
@@ -244,8 +252,7 @@ class TestQualityDescriptor:
             default = kwargs.get("default")
             null = kwargs.get("null")
             descriptor = quality(**kwargs)
-            Dummy = type("Dummy", (), {"q": descriptor})
-            d = Dummy()
+            d = build_dummy(descriptor)
             d.q = None
             expected = None if default is UNSET and null is UNSET else null or default
             assert d.q is not UNSET
@@ -257,8 +264,7 @@ class TestQualityDescriptor:
             default = kwargs.get("default")
             null = kwargs.get("null")
             descriptor = quality(**kwargs)
-            Dummy = type("Dummy", (), {"q": descriptor})
-            d = Dummy()
+            d = build_dummy(descriptor)
             d.q = ...
             expected = ... if default is UNSET and null is UNSET else default or null
             assert d.q is not UNSET
@@ -268,9 +274,8 @@ class TestQualityDescriptor:
         def test_set(self, kwargs):
             """Test set value."""
             descriptor = quality(**kwargs)
-            Dummy = type("Dummy", (), {"q": descriptor})
-            d = Dummy()
-            q = Mock()
+            d = build_dummy(descriptor)
+            q = object()
             d.q = q
             assert d.q is q
             assert d.q is getattr(d, descriptor.private_name)
@@ -278,11 +283,10 @@ class TestQualityDescriptor:
     def test_delete(self):
         """Test `quality` descriptor `__delete__` logic."""
         descriptor = quality()
-        Dummy = type("Dummy", (), {"q": descriptor})
-        d = Dummy()
+        d = build_dummy(descriptor)
         assert not hasattr(d, descriptor.private_name)
         del d.q  # Does not raise error
-        q = Mock()
+        q = object()
         d.q = q
         assert getattr(d, descriptor.private_name) is q
         del d.q
@@ -292,9 +296,8 @@ class TestQualityDescriptor:
         """Test `quality` descriptor `fval` attribute."""
         fval = Mock()
         descriptor = quality(fval=fval)
-        Dummy = type("Dummy", (), {"q": descriptor})
-        d = Dummy()
-        q = Mock()
+        d = build_dummy(descriptor)
+        q = object()
         d.q = q
         fval.assert_called_once_with(d, q)
 
@@ -302,9 +305,8 @@ class TestQualityDescriptor:
         """Test `quality` descriptor `feff` attribute."""
         feff = Mock()
         descriptor = quality(feff=feff)
-        Dummy = type("Dummy", (), {"q": descriptor})
-        d = Dummy()
-        q = Mock()
+        d = build_dummy(descriptor)
+        q = object()
         d.q = q
         feff.assert_called_once_with(d)
         feff.reset_mock()
@@ -318,7 +320,7 @@ class TestQualityDecorators:
     def test_validator(self):
         """Test validator decorator."""
         q = quality()
-        fval = Mock()
+        fval = object()
         qq = q.validator(fval)
         assert qq is not q
         assert qq.fval is fval
@@ -332,7 +334,7 @@ class TestQualityDecorators:
     def test_side_effect(self):
         """Test side effect decorator."""
         q = quality()
-        feff = Mock()
+        feff = object()
         qq = q.side_effect(feff)
         assert qq is not q
         assert qq.fval is q.fval
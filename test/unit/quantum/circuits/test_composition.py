@@ -12,8 +12,6 @@
 
 from __future__ import annotations
 
-from functools import reduce
-
 from numpy.random import default_rng
 from pytest import mark
 from qiskit.circuit import QuantumCircuit
@@ -37,7 +35,9 @@ class TestComposeCircuitsWMetadata:
         circuits = tuple(random_circuit(num_qubits, num_qubits, seed=s) for s in seeds)
         for circuit, seed in zip(circuits, seeds):
             circuit.metadata = {"seed": seed}
-        expected = reduce(lambda base, next: base.compose(next), circuits)  # Note: deepcopies
+        expected = circuits[0].copy()
+        for circuit in circuits[1:]:
+            expected.compose(circuit, inplace=True)
         expected.metadata = {k: v for c in circuits for k, v in c.metadata.items()}
         # Test
         composition = compose_circuits_w_metadata(*circuits, inplace=False)
@@ -49,12 +49,25 @@ class TestComposeCircuitsWMetadata:
         assert composition == expected
         assert composition.metadata == expected.metadata
 
+    @mark.parametrize("inplace", [False, True])
+    def test_single_circuit(self, inplace):
+        """Test composition of a single circuit."""
+        # Case
+        circuit = random_circuit(2, 2, seed=0)
+        circuit.metadata = {"seed": 0}
+        expected = circuit.copy()
+        # Test
+        composition = compose_circuits_w_metadata(circuit, inplace=inplace)
+        assert (composition is circuit) is inplace
+        assert composition == expected
+        assert composition.metadata == expected.metadata
+
     def test_inplace_default(self):
         """Test inplace arg default (i.e. inplace=False)."""
         # Case
         qc = QuantumCircuit(3)
         qc.x(qc.qubits)
         qc.metadata = {}
-        circuits = [qc] * 4
+        circuits = [qc, QuantumCircuit(3)]
         # Test
         assert compose_circuits_w_metadata(*circuits) is not circuits[0]
@@ -12,6 +12,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pytest import mark
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.random import random_circuit
@@ -70,6 +72,22 @@ def radial_circuit(num_qubits: int, center: int = 0) -> QuantumCircuit:
     return circuit
 
 
+@lru_cache(maxsize=None)
+def transpiled_radial_circuit(target_num_qubits: int, layout: tuple[int, ...]) -> QuantumCircuit:
+    """Transpile radial circuit onto radial coupling map (shared across tests, do not mutate)."""
+    return transpile(
+        radial_circuit(len(layout), center=0),
+        initial_layout=list(layout),
+        coupling_map=radial_coupling_map(target_num_qubits, center=0),
+    )
+
+
+@lru_cache(maxsize=None)
+def untranspiled_random_circuit(num_qubits: int) -> QuantumCircuit:
+    """Build random circuit seeded on its size (shared across tests, do not mutate)."""
+    return random_circuit(num_qubits, depth=1, seed=num_qubits)
+
+
 ################################################################################
 ## TESTS
 ################################################################################
@@ -79,19 +97,14 @@ class TestInferInitialPermutation:
     @mark.parametrize("target_num_qubits, layout", permutation_cases())
     def test_permutation(self, target_num_qubits, layout):
         """Test permutation."""
-        num_qubits = len(layout)
-        circuit = transpile(
-            radial_circuit(num_qubits, center=0),
-            initial_layout=layout,
-            coupling_map=radial_coupling_map(target_num_qubits, center=0),
-        )
+        circuit = transpiled_radial_circuit(target_num_qubits, tuple(layout))
         expected = layout + [i for i in range(target_num_qubits) if i not in layout]
         assert infer_initial_permutation(circuit) == tuple(expected)
 
     @mark.parametrize("num_qubits", range(1, 10))
     def test_untranspiled(self, num_qubits):
         """Test trivial permutation if circuit has not been transpiled."""
-        circuit = random_circuit(num_qubits, depth=1, seed=num_qubits)
+        circuit = untranspiled_random_circuit(num_qubits)
         assert infer_initial_permutation(circuit) == tuple(range(num_qubits))
 
 
@@ -101,23 +114,19 @@ class TestInferFinalPermutation:
     @mark.parametrize("target_num_qubits, layout", permutation_cases())
     def test_permutation(self, target_num_qubits, layout):
         """Test permutation."""
-        num_qubits = len(layout)
-        circuit = transpile(
-            radial_circuit(num_qubits, center=0),
-            initial_layout=layout,
-            coupling_map=radial_coupling_map(target_num_qubits, center=0),
-        )
+        circuit = transpiled_radial_circuit(target_num_qubits, tuple(layout))
+        final_layout = circuit.layout.final_layout
         expected = (
             range(target_num_qubits)
-            if not circuit.layout.final_layout
-            else (circuit.layout.final_layout[q] for q in circuit.qubits)
+            if not final_layout
+            else (final_layout[q] for q in circuit.qubits)
         )
         assert infer_final_permutation(circuit) == tuple(expected)
 
     @mark.parametrize("num_qubits", range(1, 10))
     def test_untranspiled(self, num_qubits):
         """Test trivial permutation if circuit has not been transpiled."""
-        circuit = random_circuit(num_qubits, depth=1, seed=num_qubits)
+        circuit = untranspiled_random_circuit(num_qubits)
         assert infer_final_permutation(circuit) == tuple(range(num_qubits))
 
 
@@ -127,24 +136,20 @@ class TestInferTotalPermutation:
     @mark.parametrize("target_num_qubits, layout", permutation_cases())
     def test_permutation(self, target_num_qubits, layout):
         """Test permutation."""
-        num_qubits = len(layout)
-        circuit = transpile(
-            radial_circuit(num_qubits, center=0),
-            initial_layout=layout,
-            coupling_map=radial_coupling_map(target_num_qubits, center=0),
-        )
+        circuit = transpiled_radial_circuit(target_num_qubits, tuple(layout))
         initial = layout + [i for i in range(target_num_qubits) if i not in layout]
+        final_layout = circuit.layout.final_layout
         final = list(
             range(target_num_qubits)
-            if not circuit.layout.final_layout
-            else (circuit.layout.final_layout[q] for q in circuit.qubits)
+            if not final_layout
+            else (final_layout[q] for q in circuit.qubits)
         )
         assert infer_total_permutation(circuit) == tuple(final[q] for q in initial)
 
     @mark.parametrize("num_qubits", range(1, 10))
     def test_untranspiled(self, num_qubits):
         """Test trivial permutation if circuit has not been transpiled."""
-        circuit = random_circuit(num_qubits, depth=1, seed=num_qubits)
+        circuit = untranspiled_random_circuit(num_qubits)
         assert infer_total_permutation(circuit) == tuple(range(num_qubits))
 
 
@@ -154,19 +159,15 @@ class TestInferTotalLayout:
     @mark.parametrize("target_num_qubits, layout", permutation_cases())
     def test_layout(self, target_num_qubits, layout):
         """Test layout."""
-        num_qubits = len(layout)
-        circuit = transpile(
-            radial_circuit(num_qubits, center=0),
-            initial_layout=layout,
-            coupling_map=radial_coupling_map(target_num_qubits, center=0),
-        )
-        initial = circuit.layout.initial_layout
-        final = circuit.layout.final_layout or Layout(dict(enumerate(circuit.qubits)))
-        expected = {q: final[circuit.qubits[i]] for q, i in initial.get_virtual_bits().items()}
+        circuit = transpiled_radial_circuit(target_num_qubits, tuple(layout))
+        transpile_layout, qubits = circuit.layout, circuit.qubits
+        initial = transpile_layout.initial_layout
+        final = transpile_layout.final_layout or Layout(dict(enumerate(qubits)))
+        expected = {q: final[qubits[i]] for q, i in initial.get_virtual_bits().items()}
         assert infer_total_layout(circuit) == Layout(expected)
 
     @mark.parametrize("num_qubits", range(1, 10))
     def test_untranspiled(self, num_qubits):
         """Test trivial layout if circuit has not been transpiled."""
-        circuit = random_circuit(num_qubits, depth=1, seed=num_qubits)
+        circuit = untranspiled_random_circuit(num_qubits)
         assert infer_total_layout(circuit) == Layout(dict(enumerate(circuit.qubits)))
@@ -19,6 +19,7 @@ from qiskit.circuit import QuantumCircuit
 from qiskit.quantum_info.operators import Pauli
 
 from pr_toolbox.quantum.circuits.measurement import (
+    _symplectic_pauli_measurement,
     build_pauli_measurement,
     get_measured_qubits,
 )
@@ -172,6 +173,14 @@ class TestBuilPauliMeasurement:
         std_pauli = Pauli(pauli)
         assert build_pauli_measurement(pauli) == build_pauli_measurement(std_pauli)
 
+    def test_cache(self):
+        """Test cached measurement circuits are not shared."""
+        hits = _symplectic_pauli_measurement.cache_info().hits
+        circuit = build_pauli_measurement("IXYIZ")
+        circuit.x(0)
+        assert build_pauli_measurement("IXYIZ") != circuit
+        assert _symplectic_pauli_measurement.cache_info().hits > hits
+
 
 class TestGetMeasuredQubits:
     """Test get measured qubits."""
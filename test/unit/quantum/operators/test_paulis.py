@@ -15,7 +15,11 @@ from __future__ import annotations
 from pytest import mark
 from qiskit.quantum_info.operators import Pauli
 
-from pr_toolbox.quantum.operators.paulis import pauli_integer_mask
+from pr_toolbox.quantum.operators.paulis import (
+    _label_integer_mask,
+    _symplectic_integer_mask,
+    pauli_integer_mask,
+)
 
 
 ################################################################################
@@ -48,6 +52,8 @@ class TestPauliIntegerMask:
             (Pauli("XY"), 0b11),
             (Pauli("YX"), 0b11),
             (Pauli("XZIZIYIXIIXI"), 0b110101010010),
+            (Pauli("Y" + "I" * 99), 1 << 99),
+            (Pauli("Z" * 100), (1 << 100) - 1),
         ],
     )
     def test_pauli_integer_mask(self, pauli, expected):
@@ -59,3 +65,18 @@ class TestPauliIntegerMask:
         """Test alternative Pauli input types."""
         std_pauli = Pauli(pauli)
         assert pauli_integer_mask(pauli) == pauli_integer_mask(std_pauli)
+        assert pauli_integer_mask((std_pauli.z, std_pauli.x)) == pauli_integer_mask(std_pauli)
+
+    @mark.parametrize(
+        "pauli, cache",
+        [
+            ("XZIZIYIXIIXI", _label_integer_mask),
+            (Pauli("-iXZIZIYIXIIXI"), _symplectic_integer_mask),
+        ],
+    )
+    def test_cache(self, pauli, cache):
+        """Test Pauli integer mask is cached."""
+        expected = pauli_integer_mask(pauli)
+        hits = cache.cache_info().hits
+        assert pauli_integer_mask(pauli) == expected
+        assert cache.cache_info().hits == hits + 1
@@ -13,6 +13,7 @@ from test import FLOAT, INT, ITERS, NO_INTS, TYPES
 
 from numpy import sqrt
 from pytest import mark, raises
+from qiskit.exceptions import QiskitError
 from qiskit.result import Counts, QuasiDistribution
 
 from pr_toolbox.quantum.results.frequencies import (
@@ -20,6 +21,7 @@ from pr_toolbox.quantum.results.frequencies import (
     bitmask_frequencies,
     counts_to_quasi_dist,
     map_frequencies,
+    outcomes_to_quasi_dist,
 )
 
 
@@ -130,12 +132,33 @@ class TestBitflipFrequencies:
                 0b11,
                 {0b11: 0, 0b10: 0.25, 0b01: 0.25, 0b00: 0.5},
             ),
+            ({0b00: 0, 0b01: 1}, 0b01, {0b00: 1, 0b01: 0}),
+            ({0b00: 0, 0b01: 0.25, 0b10: 0.75}, 0b11, {0b11: 0, 0b10: 0.25, 0b01: 0.75}),
         ],
     )
     def test_bitflip_frequencies(self, frequencies, bitflips, expected):
         """Test bitflip frequencies base functionality."""
         assert bitflip_frequencies(frequencies, bitflips) == type(frequencies)(expected)
 
+    @mark.parametrize("frequencies", [t for t in TYPES if not (isinstance(t, dict))])
+    def test_wrong_frequency_type(self, frequencies):
+        """Test a non-FrequencyLike input."""
+        with raises(TypeError):
+            bitflip_frequencies(frequencies, 0b1)
+
+    @mark.parametrize("frequencies", [{FLOAT: INT}, {INT: None}])
+    def test_wrong_dict_entry_types(self, frequencies):
+        """Test a dict input with wrong entry types."""
+        with raises(TypeError):
+            bitflip_frequencies(frequencies, 0b1)
+
+    def test_noop_copy(self):
+        """Test null bitflips return a new dict."""
+        frequencies = {0b00: 0, 0b01: 1}
+        flipped = bitflip_frequencies(frequencies, 0b00)
+        assert flipped == frequencies
+        assert flipped is not frequencies
+
 
 class TestMaskFrequencies:
     """Test mask frequencies."""
@@ -179,6 +202,10 @@ class TestMaskFrequencies:
                 0b11,
                 {0b00: 0, 0b01: 0.25, 0b10: 0.25, 0b11: 0.5},
             ),
+            (dict, {0b00: 0, 0b01: 1, 0b10: 2, 0b11: 3}, 0b01, {0b00: 2, 0b01: 4}),
+            (dict, {0b00: 0, 0b01: 0.25, 0b10: 0.25, 0b11: 0.5}, 0b10, {0b00: 0.25, 0b10: 0.75}),
+            (dict, {0b0001: 1, 0b0011: 2}, 0b1111, {0b0001: 1, 0b0011: 2}),
+            (dict, {0b0001: 1, 0b1011: 2}, 0b0111, {0b0001: 1, 0b0011: 2}),
         ],
     )
     def test_bitmask_frequencies(self, frequency_type, frequencies, mask, expected):
@@ -186,6 +213,19 @@ class TestMaskFrequencies:
         frequencies = frequency_type(frequencies)
         assert bitmask_frequencies(frequencies, mask) == frequency_type(expected)
 
+    @mark.parametrize("frequencies", [t for t in TYPES if not (isinstance(t, dict))])
+    def test_wrong_frequency_type(self, frequencies):
+        """Test a non-FrequencyLike input."""
+        with raises(TypeError):
+            bitmask_frequencies(frequencies, 0b1)
+
+    def test_noop_copy(self):
+        """Test masks covering all readouts return a new dict."""
+        frequencies = {0b00: 0, 0b01: 1}
+        masked = bitmask_frequencies(frequencies, 0b11)
+        assert masked == frequencies
+        assert masked is not frequencies
+
 
 class TestFrequencyConversion:
     """Test conversion from counts to quasi-distributions."""
@@ -205,6 +245,10 @@ class TestFrequencyConversion:
             Counts({0: 0, 1: 5}),
             Counts({12: 1, 13: 5, 14: 1}),
             Counts({5: 6}),
+            Counts({"00": 1, "01": 2, "11": 3}),
+            Counts({"0 1": 1, "1 1": 3}),
+            Counts({"0b01": 1, "0b11": 3}),
+            Counts({"0x1": 1, "0x3": 3}),
         ],
     )
     def test_convert_counts_to_quasi_dist(self, counts):
@@ -217,3 +261,26 @@ class TestFrequencyConversion:
         assert quasi_dists == {
             k: v / (quasi_dists.shots or 1) for k, v in counts.int_outcomes().items()
         }
+
+    @mark.parametrize("outcomes", [t for t in TYPES if not isinstance(t, dict)])
+    def test_wrong_outcomes_type(self, outcomes):
+        """Test wrong outcomes types upon conversion."""
+        with raises(TypeError):
+            outcomes_to_quasi_dist(outcomes)
+
+    @mark.parametrize("outcomes", [{}, {0: 0, 1: 1}, {0: 1, 1: 1}, {12: 1, 13: 5, 14: 1}, {5: 6}])
+    def test_convert_outcomes_to_quasi_dist(self, outcomes):
+        """Test convert outcomes functionality."""
+        quasi_dist = outcomes_to_quasi_dist(outcomes)
+        assert isinstance(quasi_dist, QuasiDistribution)
+        assert quasi_dist.shots == sum(outcomes.values())
+        if quasi_dist.shots:
+            assert quasi_dist.stddev_upper_bound == sqrt(1 / quasi_dist.shots)
+        assert quasi_dist == {k: v / (quasi_dist.shots or 1) for k, v in outcomes.items()}
+
+    def test_dit_strings(self):
+        """Test counts with dit strings cannot be converted."""
+        with raises(QiskitError):
+            counts_to_quasi_dist(Counts({"02": 1, "11": 3}))
+        with raises(QiskitError):
+            counts_to_quasi_dist(Counts({"": 1, "11": 3}))
@@ -11,17 +11,22 @@
 """Tests for result reckoning tools."""
 from test import NO_ITERS
 
-from numpy import isclose, sqrt
+from numpy import complex64, complex128, float64, isclose, sqrt, uint64
 from numpy.random import default_rng
 from pytest import mark, raises
-from qiskit.quantum_info.operators import Pauli, SparsePauliOp
+from qiskit.quantum_info.operators import Pauli, PauliList, SparsePauliOp
 from qiskit.result import Counts, QuasiDistribution
 
+from pr_toolbox.quantum.results import reckoning
 from pr_toolbox.quantum.results.frequencies import counts_to_quasi_dist
 from pr_toolbox.quantum.results.reckoning import (
     CanonicalReckoner,
     ExpvalReckoner,
     ReckoningResult,
+    _pack_words,
+    _pauli_list_arrays,
+    _symplectic_list_masks,
+    _to_python_scalar,
 )
 
 
@@ -46,6 +51,21 @@ class TestExpvalReckoner:
             assert isinstance(valid, QuasiDistribution)
             assert valid == expected
 
+    @mark.parametrize("frequencies", [{-1: 1}, {0: 1, -1: 1}, {0: 1, -(2**64): 1}])
+    def test_validate_frequencies_negative(self, frequencies):
+        """Test validate frequencies raises on negative readouts."""
+        for frequencies in (frequencies, Counts(frequencies), QuasiDistribution(frequencies)):
+            with raises(ValueError):
+                ExpvalReckoner._validate_frequencies(frequencies)
+
+    @mark.parametrize("frequencies", [{"0": 1, "1": 3}, {"0b0": 1, "0b1": 3}, {"0x0": 1, "0x1": 3}])
+    def test_validate_frequencies_string_keys(self, frequencies):
+        """Test validate frequencies from counts dictionaries with string keys."""
+        valid = ExpvalReckoner._validate_frequencies(frequencies)
+        assert isinstance(valid, QuasiDistribution)
+        assert valid == QuasiDistribution({0: 0.25, 1: 0.75})
+        assert valid.shots == 4
+
     @mark.parametrize(
         "frequencies, expected",
         [
@@ -133,6 +153,15 @@ class TestExpvalReckoner:
         assert all(isinstance(c, SparsePauliOp) for c in valid)
         assert valid == expected
 
+    def test_validate_normalized_passthrough(self):
+        """Test already normalized inputs are returned as is."""
+        operator = SparsePauliOp(["IZ", "XY"], [1, 2j])
+        assert ExpvalReckoner._validate_operator(operator) is operator
+        pauli = Pauli("-iXYZ")
+        assert ExpvalReckoner._validate_pauli(pauli) is pauli
+        frequencies = QuasiDistribution({0: 0.5, 1: 0.5})
+        assert ExpvalReckoner._validate_frequencies(frequencies) is frequencies
+
     @mark.parametrize("operators", NO_ITERS)
     def test_validate_operator_list_type_error(self, operators):
         """Test validate operators raises errors."""
@@ -163,6 +192,40 @@ class TestExpvalReckoner:
         with raises(ValueError):
             ExpvalReckoner._cross_validate_lists(["c"] * size, ["o"] * rng.integers(256))
 
+    @mark.parametrize("seed", range(4))
+    def test_reckon_operator_default(self, seed):
+        """Test default reckon operator composes `_reckon_pauli` consistently with canonical."""
+
+        class ComposedReckoner(CanonicalReckoner):
+            def _reckon_operator(self, frequencies, operator):
+                return ExpvalReckoner._reckon_operator(self, frequencies, operator)
+
+        rng = default_rng(seed)
+        frequencies = {
+            int(r): int(f) for r, f in zip(rng.integers(16, size=8), rng.integers(9, size=8))
+        }
+        labels = ["".join(rng.choice(list("IXYZ"), size=4)) for _ in range(4)]
+        operator = SparsePauliOp(labels, rng.normal(size=4) + 1j * rng.normal(size=4))
+        expected = CanonicalReckoner().reckon_operator(frequencies, operator)
+        result = ComposedReckoner().reckon_operator(frequencies, operator)
+        assert isclose(result.expval, expected.expval)
+        assert isclose(result.std_error, expected.std_error)
+
+    def test_reckon_operator_default_override(self):
+        """Test default reckon operator goes through overridden `_reckon_frequencies`."""
+
+        class ConstantReckoner(CanonicalReckoner):
+            def _reckon_operator(self, frequencies, operator):
+                return ExpvalReckoner._reckon_operator(self, frequencies, operator)
+
+            def _reckon_frequencies(self, frequencies):
+                return ReckoningResult(0.5, 0.25)
+
+        operator = SparsePauliOp(["Z", "X"], [1, 2j])
+        result = ConstantReckoner().reckon_operator({0: 1}, operator)
+        assert isclose(result.expval, 0.5 + 1j)
+        assert isclose(result.std_error, 0.25 * sqrt(5))
+
 
 @mark.parametrize("reckoner", [CanonicalReckoner()])
 class TestCanonicalReckoner:
@@ -291,6 +354,8 @@ class TestCanonicalReckoner:
             ({0: 1, 1: 1}, SparsePauliOp(["Y", "Z"], [1, 2]), ReckoningResult(0, sqrt(5 / 2))),
             ({0: 1, 1: 1}, SparsePauliOp(["Y", "X"], [1, 2]), ReckoningResult(0, sqrt(5 / 2))),
             ({0: 1, 1: 1}, SparsePauliOp(["Y", "Y"], [1, 2]), ReckoningResult(0, sqrt(5 / 2))),
+            ({1 << 70: 1}, SparsePauliOp(["I", "Z"], [1, 2]), ReckoningResult(3, 0)),
+            ({1: 1}, SparsePauliOp(["Z" + "I" * 69, "X" * 70], [1, 2]), ReckoningResult(-1, 0)),
         ],
     )
     @mark.parametrize("global_coeff", [1, 1j, 1 + 1j, 0.5 + 2j])
@@ -311,6 +376,61 @@ class TestCanonicalReckoner:
         assert isinstance(result.std_error, (int, float))
         assert isclose(result.std_error, sqrt(var_coeff) * expected.std_error)
 
+    @mark.parametrize("max_broadcast_size", [1, 8])
+    def test_reckon_operator_chunks(self, reckoner, max_broadcast_size, monkeypatch):
+        """Test reckon operator with masks broadcast in chunks."""
+        frequencies = {0: 0, 1: 1, 2: 2, 3: 3}
+        operator = SparsePauliOp(["II", "IZ", "ZI", "XX", "YI"], [1, 2, 3, 4j, 5])
+        expected = reckoner.reckon_operator(frequencies, operator)
+        monkeypatch.setattr(reckoning, "MAX_BROADCAST_SIZE", max_broadcast_size)
+        result = reckoner.reckon_operator(frequencies, operator)
+        assert isclose(result.expval, expected.expval)
+        assert isclose(result.std_error, expected.std_error)
+
+    def test_reckon_negative_readouts(self, reckoner):
+        """Test reckon methods raise on negative readouts."""
+        frequencies = {-1: 1, 0: 1}
+        with raises(ValueError):
+            reckoner.reckon_frequencies(frequencies)
+        with raises(ValueError):
+            reckoner.reckon_pauli(frequencies, "Z")
+        with raises(ValueError):
+            reckoner.reckon_operator(frequencies, "Z")
+        with raises(ValueError):
+            reckoner.reckon([frequencies], ["Z"])
+
+    def test_reckon_operator_mutated(self, reckoner):
+        """Test reckon operator after mutating its Paulis in place."""
+        frequencies = {0: 0, 1: 1, 2: 2, 3: 3}
+        operator = SparsePauliOp(["IZ", "XI"])
+        reckoner.reckon_operator(frequencies, operator)
+        operator.paulis.phase = [2, 0]
+        operator.paulis[1] = Pauli("YY")
+        expected = sum(reckoner.reckon_pauli(frequencies, p).expval for p in operator.paulis)
+        assert isclose(reckoner.reckon_operator(frequencies, operator).expval, expected)
+
+    @mark.parametrize("seed", range(4))
+    @mark.parametrize("max_broadcast_size", [1, 2**16])
+    def test_reckon_operator_wide(self, reckoner, seed, max_broadcast_size, monkeypatch):
+        """Test reckon operator with readouts and masks wider than 64 bits."""
+        monkeypatch.setattr(reckoning, "MAX_BROADCAST_SIZE", max_broadcast_size)
+        rng = default_rng(seed)
+        num_bits = int(rng.integers(65, 200))
+        frequencies = {
+            int.from_bytes(rng.bytes(32), "little") >> (256 - num_bits): int(rng.integers(1, 9))
+            for _ in range(16)
+        }
+        labels = ["".join(rng.choice(list("IXYZ"), size=num_bits)) for _ in range(8)]
+        operator = SparsePauliOp(labels, rng.normal(size=8) + 1j * rng.normal(size=8))
+        expected_expval, expected_variance = 0, 0
+        for pauli, coeff in zip(operator.paulis, operator.coeffs):
+            expval, std_error = reckoner.reckon_pauli(frequencies, pauli)
+            expected_expval += coeff * expval
+            expected_variance += abs(coeff) ** 2 * std_error**2
+        result = reckoner.reckon_operator(frequencies, operator)
+        assert isclose(result.expval, expected_expval)
+        assert isclose(result.std_error, sqrt(expected_variance))
+
     @mark.parametrize("frequency_type", (dict, Counts, QuasiDistribution))
     @mark.parametrize(
         "frequencies, pauli, expected",
@@ -388,6 +508,8 @@ class TestCanonicalReckoner:
             ({1: 0}, ReckoningResult(0, 1)),
             ({1: 1}, ReckoningResult(-1, 0)),
             ({0: 1, 1: 1}, ReckoningResult(0, 1 / sqrt(2))),
+            ({1 << 70: 1}, ReckoningResult(-1, 0)),
+            ({0: 1, (1 << 70) | 1: 1}, ReckoningResult(1, 0)),
         ],
     )
     def test_reckon_frequencies(self, reckoner, frequency_type, frequencies, expected):
@@ -402,3 +524,79 @@ class TestCanonicalReckoner:
         assert isclose(result.expval, expected.expval)
         assert isinstance(result.std_error, (int, float))
         assert isclose(result.std_error, expected.std_error)
+
+
+class TestPauliListArrays:
+    """Test Pauli list arrays."""
+
+    def test_pauli_list_arrays(self):
+        """Test Pauli list arrays base functionality."""
+        masks, phase_coeffs = _pauli_list_arrays(PauliList(["IZ", "-XI", "iYY", "-iII"]))
+        assert masks.tolist() == [0b01, 0b10, 0b11, 0b00]
+        assert phase_coeffs.tolist() == [1, -1, 1j, -1j]
+
+    def test_cache(self):
+        """Test Pauli list masks are cached by symplectic data."""
+        masks, _ = _pauli_list_arrays(PauliList(["IZ", "XI"]))
+        hits = _symplectic_list_masks.cache_info().hits
+        assert _pauli_list_arrays(PauliList(["-IZ", "iXI"]))[0] is masks
+        assert _symplectic_list_masks.cache_info().hits == hits + 1
+        assert not masks.flags.writeable
+
+    def test_mutation(self):
+        """Test Pauli list arrays reflect in place mutations."""
+        paulis = PauliList(["IZ", "XI"])
+        _pauli_list_arrays(paulis)
+        paulis.phase = [2, 0]
+        paulis[1] = Pauli("YY")
+        masks, phase_coeffs = _pauli_list_arrays(paulis)
+        assert masks.tolist() == [0b01, 0b11]
+        assert phase_coeffs.tolist() == [-1, 1]
+
+    def test_overflow(self):
+        """Test Pauli masks wider than 64 bits raise."""
+        with raises(OverflowError):
+            _pauli_list_arrays(PauliList(["X" + "I" * 64]))
+
+
+class TestPackWords:
+    """Test pack words."""
+
+    @mark.parametrize(
+        "integers, num_words, expected",
+        [
+            ([], 1, []),
+            ([], 2, []),
+            ([0, 1, 2**64 - 1], 1, [[0], [1], [2**64 - 1]]),
+            ([1, 1 << 64, (1 << 127) | 3], 2, [[1, 0], [0, 1], [3, 1 << 63]]),
+            ([1 << 64], 3, [[0, 1, 0]]),
+        ],
+    )
+    def test_pack_words(self, integers, num_words, expected):
+        """Test pack words base functionality."""
+        words = _pack_words(integers, num_words)
+        assert words.dtype == uint64
+        assert words.shape == (len(integers), num_words)
+        assert words.tolist() == expected
+
+
+class TestToPythonScalar:
+    """Test cast to python scalar."""
+
+    @mark.parametrize(
+        "value, expected",
+        [
+            (0, 0.0),
+            (1.5, 1.5),
+            (float64(-2), -2.0),
+            (1 + 1e-20j, 1.0),
+            (complex128(-1j), -1j),
+            (complex64(1 + 2j), 1 + 2j),
+            (complex128(3 + 1e-20j), 3.0),
+        ],
+    )
+    def test_to_python_scalar(self, value, expected):
+        """Test cast to python scalar base functionality."""
+        scalar = _to_python_scalar(value)
+        assert type(scalar) is type(expected)  # pylint: disable=unidiomatic-typecheck
+        assert scalar == expected
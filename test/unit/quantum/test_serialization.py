@@ -10,6 +10,8 @@
 
 """Tests for quantum serialization tools."""
 
+from json import loads
+
 from numpy import array
 from pytest import mark
 from qiskit.primitives import EstimatorResult
@@ -43,7 +45,22 @@ class TestEstimatorResultEncoder:
         """Test default method."""
         result = EstimatorResult(values=values, metadata=metadata)
         enc = EstimatorResultEncoder()
-        assert enc.default(result) == {"values": result.values, "metadata": result.metadata}
+        assert enc.default(result) == {"values": result.values.tolist(), "metadata": metadata}
+
+    def test_dumps(self):
+        """Test dumps method."""
+        result = EstimatorResult(values=array([1.5, -2.0]), metadata=[{"variance": 0}, {}])
+        assert loads(EstimatorResultEncoder.dumps(result)) == {
+            "values": [1.5, -2.0],
+            "metadata": [{"variance": 0}, {}],
+        }
+
+    @mark.parametrize("values", [[], [1.0], [1.5, -2.0]])
+    def test_default_list_values(self, values):
+        """Test default method with list values."""
+        result = EstimatorResult(values=values, metadata=[{}] * len(values))
+        enc = EstimatorResultEncoder()
+        assert enc.default(result) == {"values": values, "metadata": result.metadata}
 
     def test_numpy_subclass(self):
         """Test extends NumPyEncoder."""
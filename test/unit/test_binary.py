@@ -12,9 +12,10 @@
 
 from __future__ import annotations
 
+from numpy import array, int64, uint64
 from pytest import mark
 
-from pr_toolbox.binary import binary_digit, parity_bit
+from pr_toolbox.binary import binary_digit, parity_bit, parity_bits
 
 
 ################################################################################
@@ -33,6 +34,39 @@ class TestParityBit:
         assert parity_bit(integer, even=True) == 1
         assert parity_bit(integer, even=False) == 0
 
+    @mark.parametrize("integer, expected", [(int64(0b011), 0), (uint64(0b111), 1)])
+    def test_numpy_integers(self, integer, expected):
+        """Test NumPy integer inputs."""
+        assert parity_bit(integer) == expected
+
+
+class TestParityBits:
+    """Test parity bits."""
+
+    @mark.parametrize(
+        "integers",
+        [[], [0b0], [0b1], [0b000, 0b011, 0b101, 0b110, 0b001, 0b010, 0b100, 0b111], [2**64 - 1]],
+    )
+    def test_parity_bits(self, integers):
+        """Test parity bits base functionality."""
+        expected = [parity_bit(integer, even=True) for integer in integers]
+        integers = array(integers, dtype=uint64)
+        assert parity_bits(integers).tolist() == expected
+
+    @mark.parametrize("num_bits", [0, 1, 2, 3, 8, 9, 33, 64])
+    def test_num_bits(self, num_bits):
+        """Test parity bits when set bits are bounded to the lowest places."""
+        integers = [i & ((1 << num_bits) - 1) for i in (0b1011, 0xFF00FF, 2**64 - 1, 2**40 + 1)]
+        expected = [parity_bit(integer, even=True) for integer in integers]
+        integers = array(integers, dtype=uint64)
+        assert parity_bits(integers, num_bits).tolist() == expected
+
+    def test_input_untouched(self):
+        """Test input array is not mutated."""
+        integers = array([0b011, 0b111], dtype=uint64)
+        parity_bits(integers)
+        assert integers.tolist() == [0b011, 0b111]
+
 
 class TestBinaryDigit:
     """Test binary digit."""
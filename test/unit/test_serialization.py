@@ -10,9 +10,6 @@
 
 """Tests for serialization tools."""
 
-from os.path import join as join_path
-from tempfile import TemporaryDirectory
-
 from numpy import array
 from pytest import mark, raises
 
@@ -42,14 +39,13 @@ from pr_toolbox.serialization import DumpEncoder, NumPyEncoder, ReprEncoder
 class TestDumpEncoder:
     """Test DumpEncoder class."""
 
-    def test_dump(self, obj, expected):
+    def test_dump(self, obj, expected, tmp_path_factory):
         """Test dump to file."""
-        with TemporaryDirectory() as tmpdir:
-            file_path = join_path(tmpdir, "zne-dump")
-            DumpEncoder.dump(obj, file=file_path)
-            with open(file_path) as f:
-                contents = f.read()
-            assert contents == expected
+        file_path = tmp_path_factory.mktemp("dump") / "zne-dump"
+        DumpEncoder.dump(obj, file=file_path)
+        with open(file_path) as f:
+            contents = f.read()
+        assert contents == expected
 
     def test_dumps(self, obj, expected):
         """Test dump to string."""
@@ -26,7 +26,7 @@ class TestIsInteger:
         """Test true."""
         assert isinteger(object)
 
-    @mark.parametrize("object", [1.2, -2.4])
+    @mark.parametrize("object", [1.2, -2.4, float("nan"), float("inf"), float("-inf")])
     def test_isinteger_false(self, object):
         """Test false."""
         assert not isinteger(object)